@@ -51,8 +51,8 @@ for workflow_file in "$WORKFLOW_DIR"/*.yml "$WORKFLOW_DIR"/*.yaml; do
 import yaml
 import sys
 try:
-    with open('$workflow_file', 'r') as f:
-        yaml.safe_load(f)
+    with open('$workflow_file', 'rb') as f:
+        yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
     print('Valid YAML')
 except yaml.YAMLError as e:
     print(f'YAML Error: {e}')
@@ -80,8 +80,8 @@ import yaml
 import sys
 
 try:
-    with open('$workflow_file', 'r') as f:
-        content = yaml.safe_load(f)
+    with open('$workflow_file', 'rb') as f:
+        content = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
     if 'jobs' in content:
         for job_name, job_config in content['jobs'].items():
@@ -115,8 +115,8 @@ for workflow_file in "$WORKFLOW_DIR"/*.yml "$WORKFLOW_DIR"/*.yaml; do
         has_triggers=$(python3 -c "
 import yaml
 try:
-    with open('$workflow_file', 'r') as f:
-        content = yaml.safe_load(f)
+    with open('$workflow_file', 'rb') as f:
+        content = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
     if 'on' in content:
         triggers = content['on']
@@ -161,8 +161,8 @@ for workflow_file in "$WORKFLOW_DIR"/*.yml "$WORKFLOW_DIR"/*.yaml; do
         has_name=$(python3 -c "
 import yaml
 try:
-    with open('$workflow_file', 'r') as f:
-        content = yaml.safe_load(f)
+    with open('$workflow_file', 'rb') as f:
+        content = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
     if 'name' in content and content['name']:
         print('Has name')